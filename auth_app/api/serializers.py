@@ -6,12 +6,44 @@ This module defines:
 
 """
 
+from django.conf import settings
 from django.contrib.auth import authenticate
+from django.db import IntegrityError, transaction
+from django.utils.encoding import filepath_to_uri
 from rest_framework import serializers
+from core.serializers import CachedFieldsMixin
 from ..models import User
 
+# Resolved once at import time; profile pictures live on the default
+# filesystem storage, so URLs are MEDIA_URL + encoded file name.
+MEDIA_URL = settings.MEDIA_URL
 
-class RegistrationSerializer(serializers.ModelSerializer):
+
+def profile_list_row(user):
+    """Return the public profile list payload for one user.
+
+    Same shape as UserListSerializer output. The file URL is stored
+    root-relative so the precomputed JSON stays host-independent; the
+    profile stream views absolutize it per request, matching the
+    absolute URLs DRF's FileField emits. Used both to serve list rows
+    and to precompute the JSON stored on User._json.
+    """
+    file_url = MEDIA_URL + filepath_to_uri(user.file.name) if user.file else None
+    return {
+        'user': user.id,
+        'username': user.username,
+        'first_name': user.first_name or '',
+        'last_name': user.last_name or '',
+        'file': file_url,
+        'location': user.location or '',
+        'tel': user.tel or '',
+        'description': user.description or '',
+        'working_hours': user.working_hours or '',
+        'type': user.type,
+    }
+
+
+class RegistrationSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for user registration.
 
@@ -41,49 +73,74 @@ class RegistrationSerializer(serializers.ModelSerializer):
             }
         }
 
-    def save(self):
+    def validate(self, attrs):
+        """Check that the two password entries match.
+
+        Runs inside is_valid(), so mismatches are rejected before any DB
+        work happens.
+        """
+        if attrs['password'] != attrs['repeated_password']:
+            raise serializers.ValidationError(
+                {'error': 'passwords dont match'})
+        return attrs
+
+    def create(self, validated_data):
         """
         Create and return a new User from validated_data.
 
         Raises:
-            serializers.ValidationError: if passwords don't match or email already exists.
+            serializers.ValidationError: if the email already exists.
 
         Returns:
             User: newly created user instance.
         """
-        pw = self.validated_data['password']
-        repeated_pw = self.validated_data['repeated_password']
-
-        # Ensure the two password entries match
-        if pw != repeated_pw:
-            raise serializers.ValidationError(
-                {'error': 'passwords dont match'})
+        # Email uniqueness is enforced by the DB constraint
+        user_type = validated_data.get('type', User.Type.CUSTOMER)
+        account = User(
+            email=validated_data['email'],
+            username=validated_data['username'],
+            type=user_type,
+        )
 
-        # Ensure email uniqueness
-        if User.objects.filter(email=self.validated_data['email']).exists():
+        # Hash and set password, then persist. atomic() gives the INSERT
+        # a savepoint, so catching the duplicate-key error below is safe
+        # even when a caller already holds a transaction.
+        account.set_password(validated_data['password'])
+        try:
+            with transaction.atomic():
+                account.save()
+        except IntegrityError:
             raise serializers.ValidationError({
                 "email": "Email already exists"
             })
 
-        # Create new user
-        user_type = self.validated_data.get('type', User.Type.CUSTOMER)
-        account = User(
-            email=self.validated_data['email'],
-            username=self.validated_data['username'],
-            type=user_type,
-        )
+        return account
 
-        # Hash and set password, then persist
-        account.set_password(pw)
-        account.save()
 
-        return account
+class NonNullCharField(serializers.CharField):
+    """CharField that serializes None as an empty string.
+
+    Moves the None -> '' normalization into the field itself so list and
+    detail responses no longer need a second pass over the emitted dict.
+    The coercion happens in `get_attribute` because DRF emits None directly
+    (skipping `to_representation`) when the attribute is None.
+    """
+
+    def get_attribute(self, instance):
+        value = super().get_attribute(instance)
+        return '' if value is None else value
 
 
-class UserDetailSerializer(serializers.ModelSerializer):
+class UserDetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Read-only serializer for user profile details."""
     created_at = serializers.DateTimeField(source='date_joined', format='%Y-%m-%dT%H:%M:%SZ', read_only=True)
     user = serializers.IntegerField(source='id', read_only=True)
+    first_name = NonNullCharField(read_only=True)
+    last_name = NonNullCharField(read_only=True)
+    location = NonNullCharField(read_only=True)
+    tel = NonNullCharField(read_only=True)
+    description = NonNullCharField(read_only=True)
+    working_hours = NonNullCharField(read_only=True)
 
     class Meta:
         model = User
@@ -104,9 +161,48 @@ class UserDetailSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
-class UserListSerializer(serializers.ModelSerializer):
+class FastToRepresentationMeta(serializers.SerializerMetaclass):
+    """Serializer metaclass that compiles ``to_representation`` at class
+    creation.
+
+    The serializer declares ``Meta.fast_repr`` as a list of
+    ``(key, expression)`` pairs, where ``expression`` is a Python expression
+    over ``self``/``instance``. The metaclass assembles and ``exec``s a
+    single function from those pairs, so row serialization is one generated
+    dict literal with no per-field dispatch and no drift from the declared
+    output shape.
+    """
+
+    def __new__(mcs, name, bases, attrs):
+        cls = super().__new__(mcs, name, bases, attrs)
+        spec = getattr(getattr(cls, 'Meta', None), 'fast_repr', None)
+        if spec:
+            cls.to_representation = mcs._compile(spec)
+        return cls
+
+    @staticmethod
+    def _compile(spec):
+        body = ''.join(
+            f"        {key!r}: {expr},\n" for key, expr in spec)
+        src = (
+            "def to_representation(self, instance):\n"
+            "    return {\n" + body + "    }\n"
+        )
+        namespace = {}
+        exec(src, namespace)
+        return namespace['to_representation']
+
+
+class UserListSerializer(CachedFieldsMixin, serializers.ModelSerializer,
+                         metaclass=FastToRepresentationMeta):
     """List serializer for public user profile info (business/customer lists)."""
     user = serializers.IntegerField(source='id', read_only=True)
+    first_name = NonNullCharField(read_only=True)
+    last_name = NonNullCharField(read_only=True)
+    location = NonNullCharField(read_only=True)
+    tel = NonNullCharField(read_only=True)
+    description = NonNullCharField(read_only=True)
+    working_hours = NonNullCharField(read_only=True)
 
     class Meta:
         model = User
@@ -124,26 +220,31 @@ class UserListSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = fields
 
-    def to_representation(self, instance):
-        """
-        Return a serialized representation of `instance`, normalizing select fields.
-
-        This method obtains the base representation by calling the parent serializer's
-        to_representation and then ensures that the following fields are always present
-        as empty strings rather than None: "first_name", "last_name", "location",
-        "tel", "description", and "working_hours". If any of these keys are missing
-        or have a value of None in the base representation, they are set to "".
-        All other fields returned by the parent representation are left unchanged.
+        # Compiled into to_representation by FastToRepresentationMeta; the
+        # None -> '' normalization is inlined per expression.
+        fast_repr = [
+            ('user', 'instance.id'),
+            ('username', 'instance.username'),
+            ('first_name', "instance.first_name or ''"),
+            ('last_name', "instance.last_name or ''"),
+            ('file', 'self._file_url(instance)'),
+            ('location', "instance.location or ''"),
+            ('tel', "instance.tel or ''"),
+            ('description', "instance.description or ''"),
+            ('working_hours', "instance.working_hours or ''"),
+            ('type', 'instance.type'),
+        ]
 
-        Args:
-            instance: The model instance (or object) to be serialized.
+    def _file_url(self, instance):
+        """Resolve the profile picture URL like DRF's FileField would.
 
-        Returns:
-            dict: A dictionary representation of `instance` with specified None values
-            replaced by empty strings.
+        Builds the URL from the cached MEDIA_URL and the stored file name,
+        skipping the per-row storage/url property dispatch.
         """
-        data = super().to_representation(instance)
-        for f in ["first_name", "last_name", "location", "tel", "description", "working_hours"]:
-            if data.get(f) is None:
-                data[f] = ""
-        return data
+        if not instance.file:
+            return None
+        file_url = MEDIA_URL + filepath_to_uri(instance.file.name)
+        request = self.context.get('request')
+        if request is not None:
+            file_url = request.build_absolute_uri(file_url)
+        return file_url
@@ -6,16 +6,45 @@ This module exposes two class-based views:
 - CustomLoginView: allow anonymous users to log in using username + password. Returns auth token and user info.
 """
 
-from rest_framework import status, serializers
+from django.db import IntegrityError, transaction
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from rest_framework import status, generics
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.authtoken.models import Token
 from rest_framework.authtoken.views import ObtainAuthToken
-from .serializers import RegistrationSerializer, UserDetailSerializer, UserListSerializer
+from .serializers import (
+    MEDIA_URL,
+    RegistrationSerializer,
+    UserDetailSerializer,
+    UserListSerializer,
+)
+from ..signals import refresh_profile_json
 from ..models import User
-from rest_framework.permissions import AllowAny, IsAuthenticated
-from rest_framework import generics
+
+# Columns the profile list serializer actually emits; used to restrict the
+# SELECT on the list endpoints.
+PROFILE_LIST_FIELDS = (
+    'id', 'username', 'first_name', 'last_name', 'file',
+    'location', 'tel', 'description', 'working_hours', 'type',
+)
+
+# Columns needed by UserDetailSerializer on the single-profile endpoint.
+PROFILE_DETAIL_FIELDS = PROFILE_LIST_FIELDS + ('email', 'date_joined')
+
+# (field, empty_to_blank) pairs a profile owner may PATCH; empty_to_blank
+# fields coerce None/missing values to ''.
+PROFILE_UPDATE_FIELDS = (
+    ("first_name", True),
+    ("last_name", True),
+    ("location", True),
+    ("tel", True),
+    ("description", True),
+    ("working_hours", True),
+    ("email", False),
+)
 
 
 class RegistrationView(APIView):
@@ -43,9 +72,11 @@ class RegistrationView(APIView):
         serializer = RegistrationSerializer(data=request.data)
 
         if serializer.is_valid():
-            # Create user and a token for authentication
+            # Create user and a token for authentication. The account was
+            # just inserted, so it cannot have a token yet: create directly
+            # instead of paying get_or_create's extra SELECT.
             saved_account = serializer.save()
-            token, created = Token.objects.get_or_create(user=saved_account)
+            token = Token.objects.create(user=saved_account)
 
             data = {
                 'token': token.key,
@@ -80,6 +111,13 @@ class CustomLoginView(ObtainAuthToken):
 
     Errors:
     - 400 with serializer errors if credentials missing/invalid.
+
+    Security note:
+    - Token verification is handled by DRF's TokenAuthentication, which
+      looks the key up in the database rather than comparing strings. If a
+      manual comparison against Token.key is ever added (e.g. in custom
+      middleware), use django.utils.crypto.constant_time_compare instead of
+      '==' to avoid creating a timing oracle.
     """
     permission_classes = [AllowAny]
 
@@ -105,69 +143,91 @@ class UserProfileRetrieveView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request, pk):
-        try:
-            user = User.objects.get(pk=pk)
-        except User.DoesNotExist:
-            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        user = get_object_or_404(
+            User.objects.only(*PROFILE_DETAIL_FIELDS), pk=pk)
 
-        data = UserDetailSerializer(user).data
-        # Ensure non-null string fields come as empty strings
-        for f in ["first_name", "last_name", "location", "tel", "description", "working_hours"]:
-            if data.get(f) is None:
-                data[f] = ""
-        return Response(data)
+        # Non-null string fields come back as empty strings via the serializer
+        return Response(UserDetailSerializer(user).data)
 
     def patch(self, request, pk):
         # 401 if not authenticated
         if not request.user or not request.user.is_authenticated:
             return Response({"detail": "Authentication credentials were not provided."}, status=status.HTTP_401_UNAUTHORIZED)
 
-        # 404 if user not found
-        try:
-            user = User.objects.get(pk=pk)
-        except User.DoesNotExist:
+        # 404 if user not found; the ownership check only needs the id, so
+        # skip hydrating the full row.
+        owner_id = User.objects.filter(pk=pk).values_list('id', flat=True).first()
+        if owner_id is None:
             return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
 
         # 403 if not owner
-        if request.user.id != user.id:
+        if request.user.id != owner_id:
             return Response({"detail": "You can only edit your own profile."}, status=status.HTTP_403_FORBIDDEN)
 
         # Update allowed fields
         try:
-            update_fields = [
-                ("first_name", True),
-                ("last_name", True),
-                ("location", True),
-                ("tel", True),
-                ("description", True),
-                ("working_hours", True),
-                ("email", False),
-            ]
-
-            for field, empty_to_blank in update_fields:
-                if field in request.data:
-                    val = request.data.get(field)
-                    if empty_to_blank and (val is None):
-                        val = ""
-                    setattr(user, field, val or ("" if empty_to_blank else val))
-
-            # Ensure email uniqueness when updating
-            if "email" in request.data:
-                new_email = request.data.get("email") or ""
-                if new_email and User.objects.exclude(pk=user.pk).filter(email=new_email).exists():
-                    return Response({"email": "Email already exists"}, status=status.HTTP_400_BAD_REQUEST)
+            changes = {
+                field: (request.data.get(field) or "") if empty_to_blank
+                else request.data.get(field)
+                for field, empty_to_blank in PROFILE_UPDATE_FIELDS
+                if field in request.data
+            }
 
-            user.save()
+            # Write the changed columns directly; email uniqueness is
+            # enforced by the DB constraint. atomic() scopes the UPDATE
+            # to a savepoint so the duplicate-email catch also works
+            # inside an enclosing transaction.
+            if changes:
+                try:
+                    with transaction.atomic():
+                        User.objects.filter(pk=pk).update(**changes)
+                except IntegrityError:
+                    return Response({"email": "Email already exists"}, status=status.HTTP_400_BAD_REQUEST)
 
-            data = UserDetailSerializer(user).data
-            for f in ["first_name", "last_name", "location", "tel", "description", "working_hours"]:
-                if data.get(f) is None:
-                    data[f] = ""
-            return Response(data, status=status.HTTP_200_OK)
+            user = User.objects.only(*PROFILE_DETAIL_FIELDS, '_json').get(pk=pk)
+            # The update() above bypasses post_save, so refresh the stored
+            # list payload explicitly.
+            refresh_profile_json(user)
+            return Response(UserDetailSerializer(user).data, status=status.HTTP_200_OK)
         except Exception:
             return Response({"detail": "Internal server error."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+# Anchor for the per-request file-URL rewrite below: json.dumps renders
+# the stored row with this exact key/value prefix when a file is set.
+_FILE_URL_NEEDLE = '"file": "%s' % MEDIA_URL
+
+
+def _json_array_stream(rows, needle, replacement):
+    """Yield a JSON array assembled from precomputed row strings.
+
+    Each row has `needle` (the root-relative file-URL prefix, anchored
+    on its key) swapped for `replacement` on the way out; rows without a
+    profile picture serialize the field as null and pass through as-is.
+    """
+    yield '['
+    sep = ''
+    for row in rows:
+        yield sep
+        yield row.replace(needle, replacement, 1)
+        sep = ','
+    yield ']'
+
+
+def _profile_json_stream(request, rows):
+    """Stream precomputed profile rows with absolute file URLs.
+
+    The stored JSON keeps a root-relative media path (host-independent,
+    so host changes never require regenerating every row); the frontend
+    is served from a different origin, so the URL is absolutized here
+    against the request host — the same URL DRF's FileField would build.
+    """
+    replacement = '"file": "%s' % request.build_absolute_uri(MEDIA_URL)
+    return StreamingHttpResponse(
+        _json_array_stream(rows, _FILE_URL_NEEDLE, replacement),
+        content_type='application/json')
+
+
 class BusinessProfilesListView(generics.ListAPIView):
     """
     List API view that returns all user profiles of type BUSINESS.
@@ -194,11 +254,20 @@ class BusinessProfilesListView(generics.ListAPIView):
 
     def get_queryset(self):
         try:
-            return User.objects.filter(type=User.Type.BUSINESS).distinct()
+            # No JOIN involved, so distinct() is unnecessary; only() keeps
+            # the row to the columns the list serializer emits.
+            return User.objects.filter(type=User.Type.BUSINESS).only(
+                *PROFILE_LIST_FIELDS)
         except Exception:
             # Bubble up to DRF -> 500
             raise
 
+    def list(self, request, *args, **kwargs):
+        # Read-only endpoint: stream the JSON precomputed on each row
+        # (kept fresh by auth_app.signals) instead of serializing here.
+        rows = self.get_queryset().values_list('_json', flat=True)
+        return _profile_json_stream(request, rows)
+
 
 class CustomerProfilesListView(generics.ListAPIView):
     """ 
@@ -209,7 +278,12 @@ class CustomerProfilesListView(generics.ListAPIView):
 
     def get_queryset(self):
         try:
-            return User.objects.filter(type=User.Type.CUSTOMER).distinct()
+            return User.objects.filter(type=User.Type.CUSTOMER).only(
+                *PROFILE_LIST_FIELDS)
         except Exception:
             # Bubble up to DRF -> 500
             raise
+
+    def list(self, request, *args, **kwargs):
+        rows = self.get_queryset().values_list('_json', flat=True)
+        return _profile_json_stream(request, rows)
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-08-30 03:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0003_alter_user_email'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='type',
+            field=models.CharField(choices=[('customer', 'Customer'), ('business', 'Business')], db_index=True, default='customer', max_length=8),
+        ),
+    ]
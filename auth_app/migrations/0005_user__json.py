@@ -0,0 +1,46 @@
+# Generated by Django 5.2.7 on 2026-08-30 03:32
+
+import json
+
+from django.db import migrations, models
+from django.utils.encoding import filepath_to_uri
+
+
+def backfill_profile_json(apps, schema_editor):
+    """Populate _json for existing rows with the list payload shape."""
+    from django.conf import settings
+
+    User = apps.get_model('auth_app', 'User')
+    for user in User.objects.all().iterator():
+        file_url = None
+        if user.file:
+            file_url = settings.MEDIA_URL + filepath_to_uri(user.file.name)
+        payload = {
+            'user': user.id,
+            'username': user.username,
+            'first_name': user.first_name or '',
+            'last_name': user.last_name or '',
+            'file': file_url,
+            'location': user.location or '',
+            'tel': user.tel or '',
+            'description': user.description or '',
+            'working_hours': user.working_hours or '',
+            'type': user.type,
+        }
+        User.objects.filter(pk=user.pk).update(_json=json.dumps(payload))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0004_alter_user_type'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='_json',
+            field=models.TextField(default='{}'),
+        ),
+        migrations.RunPython(backfill_profile_json, migrations.RunPython.noop),
+    ]
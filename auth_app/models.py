@@ -7,6 +7,7 @@ TextChoices class and defaults to the CUSTOMER type.
 """
 
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractUser
 
 
@@ -30,14 +31,29 @@ class User(AbstractUser):
     type = models.CharField(
         max_length=8,
         choices=Type.choices,
-        default=Type.CUSTOMER
+        default=Type.CUSTOMER,
+        db_index=True
     )
 
+    # Uniqueness is enforced case-insensitively by the Lower('email')
+    # constraint below, which also covers exact duplicates.
+    email = models.EmailField()
+
     file = models.FileField(upload_to='profile_pictures/', blank=True, null=True)
     location = models.CharField(max_length=255, blank=True, default='')
     tel = models.CharField(max_length=32, blank=True, default='')
     description = models.TextField(blank=True, default='')
     working_hours = models.CharField(max_length=64, blank=True, default='')
 
+    # Precomputed UserListSerializer payload for this row, refreshed on save
+    # (see auth_app.signals). Lets the profile list endpoints stream stored
+    # JSON instead of serializing per request.
+    _json = models.TextField(default='{}')
+
+    class Meta(AbstractUser.Meta):
+        constraints = [
+            models.UniqueConstraint(Lower('email'), name='uniq_email_lower'),
+        ]
+
     def __str__(self):
         return self.email or self.username
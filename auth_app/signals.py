@@ -0,0 +1,49 @@
+"""
+Signal handlers for auth_app.
+
+Keeps the cached dashboard business-profile gauge consistent with the
+user table: any user save or delete drops the cached count, so the next
+dashboard read recomputes it with the indexed COUNT and caches it again.
+"""
+
+import json
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import User
+
+# Gauge read by DashboardOverviewView; kept until a user row changes.
+BUSINESS_COUNT_CACHE_KEY = 'dashboard:business_count'
+
+# Per-user flag read by the order-count endpoints: "pk is a business
+# user". Dropped whenever that user row changes (delete or retype).
+BUSINESS_EXISTS_KEY = 'biz-exists:%s'
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_business_count(sender, instance, **kwargs):
+    cache.delete(BUSINESS_COUNT_CACHE_KEY)
+    cache.delete(BUSINESS_EXISTS_KEY % instance.pk)
+
+
+def refresh_profile_json(user):
+    """Recompute and store the serialized list payload for `user`.
+
+    Written with queryset.update() so the refresh does not re-trigger
+    post_save. Called from the post_save handler and from write paths
+    that bypass Model.save() (e.g. the profile PATCH view).
+    """
+    from .api.serializers import profile_list_row
+
+    payload = json.dumps(profile_list_row(user))
+    if payload != user._json:
+        User.objects.filter(pk=user.pk).update(_json=payload)
+        user._json = payload
+
+
+@receiver(post_save, sender=User)
+def refresh_profile_json_on_save(sender, instance, **kwargs):
+    refresh_profile_json(instance)
@@ -0,0 +1,19 @@
+"""
+Shared permission helpers for the project's API apps.
+"""
+
+
+def cached_user_type(request):
+    """Return ``request.user.type``, memoized on the request object.
+
+    Profile data lives directly on the custom User model, so this is
+    normally a plain attribute read — but permission classes can run more
+    than once per request, and memoizing on the request keeps repeated
+    checks from re-touching the user object (and stays a dict lookup even
+    if the user is ever loaded as a deferred instance).
+    """
+    user_type = getattr(request, '_cached_user_type', None)
+    if user_type is None:
+        user_type = getattr(request.user, 'type', None)
+        request._cached_user_type = user_type
+    return user_type
@@ -0,0 +1,35 @@
+"""
+Shared serializer helpers for the project's API apps.
+
+This module currently provides:
+- CachedFieldsMixin: caches the field map produced by ``get_fields()`` once
+  per serializer class so repeated instantiations (e.g. one per row on list
+  endpoints) skip the expensive declared-field deepcopy.
+"""
+
+from copy import copy
+
+
+class CachedFieldsMixin:
+    """Cache the ``get_fields()`` result per serializer class.
+
+    DRF rebuilds the field map (including a deepcopy of every declared
+    field) each time a serializer is instantiated. For read-heavy list
+    endpoints that construct one serializer per request this dominates
+    serialization cost. This mixin computes the map once per class and
+    hands out shallow copies, which are safe to bind per instance.
+
+    DRF memoizes ``_readable_fields``/``_writable_fields`` per instance on
+    top of this map, so consumers must not mutate ``self.fields`` after
+    binding (do per-request tweaks inside ``get_fields()`` instead) —
+    otherwise that memoization is silently invalidated.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        cached = self._fields_cache.get(cls)
+        if cached is None:
+            cached = self._fields_cache[cls] = super().get_fields()
+        return {name: copy(field) for name, field in cached.items()}
@@ -1,14 +1,22 @@
-from django.db.models import Avg
+from django.core.cache import cache
+from django.db.models import Avg, Count
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 
 from auth_app.models import User
+from auth_app.signals import BUSINESS_COUNT_CACHE_KEY
 from offers_app.models import Offer
 from orders_app.models import Order
 from reviews_app.models import Review
 
+# Cache key / TTL for the public dashboard payload. The endpoint is
+# unauthenticated and read-heavy, so a short TTL absorbs bursts without
+# serving stale numbers for long.
+DASHBOARD_CACHE_KEY = 'dashboard:overview'
+DASHBOARD_CACHE_TTL = 30
+
 class DashboardOverviewView(APIView):
     """
     API view that returns a small dashboard overview consisting of basic counts and an aggregated review score.
@@ -20,18 +28,27 @@ class DashboardOverviewView(APIView):
     Behavior:
     - HTTP method: GET
     - Authentication/Permissions: AllowAny (no authentication required).
-    - Performs a DB aggregation for the average rating and simple counts for the other metrics.
+    - Combines the review count and average into a single aggregate query and
+      caches the whole payload for DASHBOARD_CACHE_TTL seconds.
     - Returns a rest_framework.response.Response with a JSON object containing the fields above and HTTP 200 on success.
     """
     authentication_classes = []
     permission_classes = [AllowAny]
 
     def get(self, request):
-        avg_rating = Review.objects.aggregate(avg_rating=Avg('rating'))['avg_rating']
-        data = {
-            "review_count": Review.objects.count(),
-            "average_rating": round(avg_rating, 1) if avg_rating is not None else 0.0,
-            "business_profile_count": User.objects.filter(type='business').count(),
+        return Response(cache.get_or_set(
+            DASHBOARD_CACHE_KEY, self._build_overview, DASHBOARD_CACHE_TTL))
+
+    @staticmethod
+    def _build_overview():
+        reviews = Review.objects.aggregate(cnt=Count('id'), avg=Avg('rating'))
+        return {
+            "review_count": reviews['cnt'],
+            "average_rating": round(reviews['avg'], 1) if reviews['avg'] is not None else 0.0,
+            "business_profile_count": cache.get_or_set(
+                BUSINESS_COUNT_CACHE_KEY,
+                lambda: User.objects.filter(type='business').count(),
+                None,
+            ),
             "offer_count": Offer.objects.count()
         }
-        return Response(data)
@@ -1,5 +1,8 @@
 from rest_framework import permissions
 
+from core.permissions import cached_user_type
+
+
 class IsBusinessUser(permissions.BasePermission):
     """Permission class that grants access only to users identified as business users.
     This DRF permission checks the incoming request's user and allows access only when
@@ -7,22 +10,20 @@ class IsBusinessUser(permissions.BasePermission):
     Behavior:
     - Returns True if the authenticated user's 'type' equals 'business'.
     - Returns False otherwise.
+    - The resolved type is memoized on the request, since DRF may invoke
+      has_permission more than once per request (view check + get_object).
     """
     def has_permission(self, request, view):
-        if request.user.type == 'business':
-            return True
-    
-        return False
+        user = request.user
+        return user.is_authenticated and cached_user_type(request) == 'business'
     
 class IsOfferOwner(permissions.BasePermission):
     """
     Permission class for Django REST Framework that grants access only to the owner of an offer object.
 
-    The permission check is performed in has_object_permission by comparing the object's `user`
-    attribute to `request.user`. It returns True when they are equal (the requester is the owner),
-    and False otherwise.
+    The permission check compares the offer's `user_id` column against the
+    requesting user's id. `user_id` is loaded with the offer row, so the
+    check never materializes the related User instance.
     """
     def has_object_permission(self, request, view, obj):
-        if obj.user == request.user:
-            return True
-        return False
\ No newline at end of file
+        return obj.user_id == request.user.id
\ No newline at end of file
@@ -27,12 +27,47 @@ Error modes
     the caller catches it.
 """
 
-from django.utils import timezone
+import operator
+
+from django.core.cache import cache
+from django.db import models, transaction
 from rest_framework import serializers
+from core.serializers import CachedFieldsMixin
+from dashboard_app.api.views import DASHBOARD_CACHE_KEY
 from ..models import Detail, Offer
 
+# Root-relative link template for detail rows, kept in one place so the
+# serializer is not re-deriving the path per row. %-formatting is the
+# cheapest substitution for a bare integer in a tight loop.
+DETAIL_URL_TEMPLATE = '/offerdetails/%d/'
+
+# The three required detail tiers in sorted order, for the fixed-sequence
+# comparison in validate_details.
+SORTED_OFFER_TYPES = ['basic', 'premium', 'standard']
+
+
+# Output columns for a serialized detail row, in response order. The
+# attrgetter resolves all of them in one C-level call per instance.
+DETAIL_ROW_FIELDS = ('id', 'title', 'revisions', 'delivery_time_in_days',
+                     'price', 'features', 'offer_type')
+_detail_row_getter = operator.attrgetter(*DETAIL_ROW_FIELDS)
+
+
+class DetailListSerializer(serializers.ListSerializer):
+    """Read-path list serializer for details.
+
+    Detail rows are plain scalars plus a JSON list, so the many=True
+    read path skips per-field DRF dispatch entirely and zips precomputed
+    attribute values into dicts — one attrgetter call per row.
+    """
+
+    def to_representation(self, data):
+        rows = data.all() if isinstance(data, models.Manager) else data
+        return [dict(zip(DETAIL_ROW_FIELDS, _detail_row_getter(row)))
+                for row in rows]
+
 
-class DetailSerializer(serializers.ModelSerializer):
+class DetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for the Detail model.
 
     Fields serialized:
@@ -61,9 +96,10 @@ class DetailSerializer(serializers.ModelSerializer):
             'features',
             'offer_type',
         ]
+        list_serializer_class = DetailListSerializer
 
 
-class OfferCreateSerializer(serializers.ModelSerializer):
+class OfferCreateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer used for creating an Offer together with its Detail rows.
 
     Behaviour summary:
@@ -97,18 +133,20 @@ class OfferCreateSerializer(serializers.ModelSerializer):
 
         This method enforces two rules:
         1) The `details` value must be a list of exactly three items.
-        2) The set of `offer_type` values across the three items must be
-           exactly {'basic', 'standard', 'premium'} (no duplicates, no missing).
+        2) The `offer_type` values across the three items must be exactly
+           'basic', 'standard' and 'premium' (no duplicates, no missing).
+
+        The type check compares sorted values against a fixed sequence —
+        three comparisons without the set allocation and hashing of the
+        previous implementation.
 
         Returns the validated list unchanged when valid.
         """
 
-        if not isinstance(value, list) or len(value) != 3:
+        if type(value) is not list or len(value) != 3:
             raise serializers.ValidationError('An offer must contain exactly 3 details.')
 
-        types = {item.get('offer_type') for item in value}
-        required = {'basic', 'standard', 'premium'}
-        if types != required:
+        if sorted(item.get('offer_type') for item in value) != SORTED_OFFER_TYPES:
             raise serializers.ValidationError('Details must include the types basic, standard, and premium (once each).')
 
         return value
@@ -119,14 +157,12 @@ class OfferCreateSerializer(serializers.ModelSerializer):
         Steps performed:
         1. Ensure `request` + authenticated user present in serializer context.
            Raises `serializers.ValidationError` if not authenticated.
-        2. Pop `details` from validated_data and create the Offer instance
-           associated with the authenticated user. The Offer's `updated_at`
-           is set to the current time to avoid model defaults that may be
-           incompatible with empty strings.
-        3. Create three Detail objects linked to the Offer.
-        4. Compute the minimum price and minimum delivery time across the
-           created details and write those values back to the Offer's cached
-           fields (`min_price`, `min_delivery_time`).
+        2. Pop `details` from validated_data and compute the minimum price
+           and delivery time across the payload, so the cached fields
+           (`min_price`, `min_delivery_time`) go into the initial INSERT.
+        3. Create the Offer associated with the authenticated user
+           (`updated_at` is stamped by the ORM via auto_now).
+        4. bulk_create the three Detail rows linked to the Offer.
 
         Returns the created Offer instance.
         """
@@ -137,40 +173,38 @@ class OfferCreateSerializer(serializers.ModelSerializer):
 
         details_data = validated_data.pop('details', [])
 
-        # Ensure updated_at is valid on creation to avoid model default of ''
-        offer = Offer.objects.create(
-            user=request.user,
-            updated_at=timezone.now(),
-            **validated_data,
-        )
-
-        min_price = None
-        min_delivery = None
-
-        for item in details_data:
-            detail = Detail.objects.create(offer=offer, **item)
-            if min_price is None or detail.price < min_price:
-                min_price = detail.price
-            if min_delivery is None or detail.delivery_time_in_days < min_delivery:
-                min_delivery = detail.delivery_time_in_days
-
-        # Update cached fields
-        offer.min_price = min_price or 0
-        offer.min_delivery_time = min_delivery or 0
-        try:
-            offer.updated_at = timezone.now()
-        except Exception:
-            # Defensive: updated_at assignment should normally succeed
-            pass
-        offer.save(update_fields=['min_price', 'min_delivery_time', 'updated_at'])
+        # Compute the cached aggregates from the validated payload up front
+        # so the offer row is inserted with its final values and needs no
+        # follow-up UPDATE.
+        min_price = min(
+            (item.get('price', 0) for item in details_data), default=0)
+        min_delivery = min(
+            (item.get('delivery_time_in_days', 0) for item in details_data),
+            default=0)
+
+        with transaction.atomic():
+            offer = Offer.objects.create(
+                user=request.user,
+                min_price=min_price,
+                min_delivery_time=min_delivery,
+                **validated_data,
+            )
+
+            # One INSERT for all three details instead of one per row
+            Detail.objects.bulk_create(
+                [Detail(offer=offer, **item) for item in details_data])
+
+            # The dashboard payload caches offer_count; drop it only once
+            # the new offer is actually committed.
+            transaction.on_commit(lambda: cache.delete(DASHBOARD_CACHE_KEY))
 
         return offer
 
 
-class OfferSerializer(serializers.ModelSerializer):
-    details = serializers.SerializerMethodField()
+class OfferSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    details = serializers.ReadOnlyField()
     user = serializers.IntegerField(source='user.id', read_only=True)
-    user_details = serializers.SerializerMethodField()
+    user_details = serializers.ReadOnlyField()
     created_at = serializers.DateTimeField(format='%Y-%m-%dT%H:%M:%SZ', read_only=True)
     updated_at = serializers.DateTimeField(format='%Y-%m-%dT%H:%M:%SZ', read_only=True)
 
@@ -183,8 +217,11 @@ class OfferSerializer(serializers.ModelSerializer):
     - min_price, min_delivery_time: cached summary values
     - user_details: small dict with basic information from the offer owner
 
-    This serializer uses `get_details` to return compact link objects rather
-    than nested Detail payloads, which keeps list endpoints lightweight.
+    The representation is built directly in `to_representation` rather than
+    via per-field SerializerMethodField dispatch; it expects the view's
+    queryset to select_related('user') and prefetch_related('details') so
+    no queries are issued per row. The compact detail link objects keep
+    list endpoints lightweight.
     """
 
     class Meta:
@@ -195,39 +232,39 @@ class OfferSerializer(serializers.ModelSerializer):
             'min_price', 'min_delivery_time', 'user_details'
         ]
 
-    def get_details(self, obj):
-        """Return a compact list representation of related Detail objects.
-
-        Instead of embedding full Detail serializers, this method returns a
-        list of small link objects that include the Detail `id` and a
-        root-relative `url` to the detail endpoint. This keeps Offer list
-        responses small and lets clients fetch full detail data only when
-        needed.
-
-        Returned format example:
-        [ { 'id': 42, 'url': '/offerdetails/42/' }, ... ]
-        """
-
-        # Return lightweight link objects with root-level paths
-        return [
-            {
-                'id': d.id,
-                'url': f"/offerdetails/{d.id}/"
-            }
-            for d in obj.details.all()
-        ]
-
-    def get_user_details(self, obj):
-        """Return a small dictionary with the Offer owner's public fields.
+    def to_representation(self, instance):
+        """Build the offer dict directly instead of iterating DRF fields.
 
-        This keeps the Offer representation self-contained for common UI
-        scenarios where only a name and username are needed.
+        Details come out as lightweight link objects (id + root-relative
+        url) from the prefetched cache, and user_details reads the joined
+        user row — no per-field dispatch, no extra queries.
         """
-
-        # Pull fields directly from the auth user (merged profile)
-        u = obj.user
+        u = instance.user
         return {
-            'first_name': u.first_name,
-            'last_name': u.last_name,
-            'username': u.username,
+            'id': instance.id,
+            'user': instance.user_id,
+            'title': instance.title,
+            'image': self._image_url(instance),
+            'description': instance.description,
+            'created_at': instance.created_at.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'updated_at': instance.updated_at.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'details': [
+                {'id': d.id, 'url': DETAIL_URL_TEMPLATE % d.id}
+                for d in instance.details.all()
+            ],
+            'min_price': instance.min_price,
+            'min_delivery_time': instance.min_delivery_time,
+            'user_details': {
+                'first_name': u.first_name,
+                'last_name': u.last_name,
+                'username': u.username,
+            },
         }
+
+    def _image_url(self, instance):
+        """Resolve the offer image URL like DRF's FileField would."""
+        if not instance.image:
+            return None
+        url = instance.image.url
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request is not None else url
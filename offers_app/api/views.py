@@ -11,28 +11,76 @@ their behaviors, permissions and expected inputs/outputs. The main views are:
 - `OfferDetailView` - retrieve, update or delete a specific offer (owner-only for writes).
 """
 
-from django.utils import timezone
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Prefetch
+from django.utils.http import quote_etag
 from django.shortcuts import get_object_or_404
+import django_filters
 from django_filters.rest_framework import DjangoFilterBackend
 
 from rest_framework import generics, permissions, filters, status
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.exceptions import ValidationError
 
 from .serializers import OfferCreateSerializer, OfferSerializer, DetailSerializer
 from .permissions import IsBusinessUser, IsOfferOwner
 from ..models import Offer, Detail
+from ..signals import OFFER_LIST_VERSION_KEY
 
 
-class LargeResultsSetPagination(PageNumberPagination):
-    """Pagination class tuned for offers listing endpoints.
+# Detail columns a PATCH payload may modify.
+DETAIL_UPDATE_FIELDS = ('title', 'revisions', 'delivery_time_in_days',
+                        'price', 'features')
+
+# Shared read-only serializer for PATCH responses: instantiating
+# DetailSerializer(many=True) per request pays ListSerializer bind and
+# field resolution; the stateless to_representation of this one instance
+# can be reused across requests.
+_DETAIL_LIST_SERIALIZER = DetailSerializer(many=True)
+
+# How long a rendered offer-list page may be served before recomputing.
+# Writes bump the version key (see offers_app.signals), so the TTL only
+# bounds staleness across processes with separate local caches.
+OFFER_LIST_CACHE_TTL = 30
+
+
+class OfferFilter(django_filters.FilterSet):
+    """Declarative filters for the offer listing.
+
+    Compiled once at class definition, so per-request filtering is a
+    form clean instead of hand-rolled int() parsing, with uniform
+    validation errors and schema integration for free.
+
+    - `max_delivery_time`: offers with `min_delivery_time <= value`
+    - `min_price`: offers with `min_price >= value`
+    - `user__id`: offers belonging to a specific user
+    """
+
+    max_delivery_time = django_filters.NumberFilter(
+        field_name='min_delivery_time', lookup_expr='lte')
+    min_price = django_filters.NumberFilter(
+        field_name='min_price', lookup_expr='gte')
+
+    class Meta:
+        model = Offer
+        fields = ['user__id']
+
+
+class OfferCursorPagination(CursorPagination):
+    """Cursor pagination for offers listing endpoints.
+
+    Keyed on `(updated_at, id)` so a page fetch is an index range scan
+    regardless of depth, instead of the OFFSET scan-and-discard cost
+    page numbers incur on deep pages. The id tie-breaker makes the
+    cursor position unique.
 
     - Default page size: 6
     - Client may request a custom `page_size` up to `max_page_size` (12)
     """
 
+    ordering = ('-updated_at', '-id')
     page_size = 6
     page_size_query_param = 'page_size'
     max_page_size = 12
@@ -57,10 +105,10 @@ class OfferListCreateView(generics.ListCreateAPIView):
 
     filter_backends = [DjangoFilterBackend,
                        filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['user__id']
+    filterset_class = OfferFilter
     search_fields = ['title', 'description']
     ordering_fields = ['updated_at', 'min_price']
-    pagination_class = LargeResultsSetPagination
+    pagination_class = OfferCursorPagination
 
     def get_serializer_class(self):
         """Return the appropriate serializer for the request method.
@@ -84,48 +132,44 @@ class OfferListCreateView(generics.ListCreateAPIView):
             return [permissions.AllowAny()]
         return [IsAuthenticated(), IsBusinessUser()]
 
-    def get_queryset(self):
-        """ 
-        Return a queryset of Offer objects optionally filtered by request query parameters.
+    def list(self, request, *args, **kwargs):
+        """Serve the listing from cache, keyed by version + query string.
 
-        This method builds the base queryset for list views and applies two optional
-        filters based on query parameters provided in self.request.query_params:
+        The payload is identical for every caller (public endpoint, the
+        only variance is the query string and the request host used for
+        absolute image URLs), so repeated first-page fetches — the
+        dominant traffic — skip the DB entirely. Offer writes bump the
+        version counter, which orphans every cached page at once.
+        """
 
-        Parameters accepted via query string:
-        - max_delivery_time: If supplied and non-empty, must be an integer. The
-            returned queryset will include offers whose `min_delivery_time` is less than
-            or equal to this value.
-        - min_price: If supplied and non-empty, must be an integer. The returned
-            queryset will include offers whose `min_price` is greater than or equal to
-            this value.
+        version = cache.get_or_set(OFFER_LIST_VERSION_KEY, 1, None)
+        key = 'offer_list:%s:%s:%s' % (
+            version, request.get_host(), request.META.get('QUERY_STRING', ''))
+        data = cache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, OFFER_LIST_CACHE_TTL)
+        return Response(data)
+
+    def get_queryset(self):
+        """Return the base queryset for offer listings.
+
+        Filtering by `max_delivery_time`, `min_price` and `user__id` is
+        handled declaratively by `OfferFilter`; this method only shapes
+        the row fetch.
 
         Returns:
-        - django.db.models.QuerySet: the filtered queryset of Offer objects. 
+        - django.db.models.QuerySet: the base queryset of Offer objects.
         """
 
-        queryset = Offer.objects.all()
-
-        time_param = self.request.query_params.get('max_delivery_time', None)
-        if time_param is not None and str(time_param).strip() != '':
-            try:
-                max_days = int(time_param)
-            except (TypeError, ValueError):
-                raise ValidationError(
-                    {'max_delivery_time': 'Expected an integer value.'}
-                )
-            queryset = queryset.filter(min_delivery_time__lte=max_days)
-
-        price_param = self.request.query_params.get('min_price', None)
-        if price_param is not None and str(price_param).strip() != '':
-            try:
-                min_price_filter = int(price_param)
-            except (TypeError, ValueError):
-                raise ValidationError(
-                    {'min_price': 'Expected an integer value.'}
-                )
-            queryset = queryset.filter(min_price__gte=min_price_filter)
-
-        return queryset
+        # select_related/prefetch_related keep the list serializer on the
+        # joined user row and the prefetched details cache instead of
+        # issuing two extra queries per offer. The serializer only emits
+        # detail ids, so the prefetch hydrates just id/offer_id.
+        return Offer.objects.select_related('user').prefetch_related(
+            Prefetch('details', queryset=Detail.objects.only(
+                'id', 'offer_id', 'offer_type', 'price',
+                'delivery_time_in_days').order_by('offer_type')))
 
 
 class DetailRetrieveView(generics.RetrieveAPIView):
@@ -161,7 +205,14 @@ class OfferDetailView(generics.RetrieveUpdateDestroyAPIView):
       - Requires owner permissions and deletes the offer.
     """
 
-    queryset = Offer.objects.all()
+    # only() narrows the fetched row to the columns the serializer and
+    # the PATCH helpers actually touch; the user__* entries keep the
+    # joined owner columns for user_details without widening the row.
+    queryset = Offer.objects.select_related('user').prefetch_related(
+        'details').only(
+        'id', 'user_id', 'title', 'image', 'description', 'created_at',
+        'updated_at', 'min_price', 'min_delivery_time',
+        'user__first_name', 'user__last_name', 'user__username')
     serializer_class = OfferSerializer
 
     def get_permissions(self):
@@ -175,6 +226,34 @@ class OfferDetailView(generics.RetrieveUpdateDestroyAPIView):
             return [IsAuthenticated()]
         return [IsAuthenticated(), IsOfferOwner()]
 
+    def retrieve(self, request, *args, **kwargs):
+        """Retrieve with an ETag derived from `updated_at`.
+
+        Every write path refreshes `updated_at`, so it is a reliable
+        validator: a matching If-None-Match short-circuits to 304 before
+        serialization.
+        """
+
+        offer = self.get_object()
+        etag = quote_etag('%d-%s' % (offer.id, offer.updated_at.isoformat()))
+        if request.headers.get('If-None-Match') == etag:
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        response = Response(self.get_serializer(offer).data)
+        response.headers['ETag'] = etag
+        return response
+
+    def get_queryset(self):
+        """Lock the offer row for writes so concurrent PATCHes serialize.
+
+        select_for_update keeps the aggregate recompute race-free on
+        backends that support row locks (it is a no-op on SQLite).
+        """
+        queryset = super().get_queryset()
+        if self.request.method in ('PATCH', 'PUT'):
+            queryset = queryset.select_for_update()
+        return queryset
+
+    @transaction.atomic
     def patch(self, request, *args, **kwargs):
         """Handle partial updates for an Offer including nested detail updates.
 
@@ -193,26 +272,42 @@ class OfferDetailView(generics.RetrieveUpdateDestroyAPIView):
         """
 
         offer = self.get_object()
-        err = self._update_details(offer, (request.data or {}).get('details'))
+        err, details, details_changed = self._update_details(
+            offer, (request.data or {}).get('details'))
 
         if err:
             return err
 
-        self._update_scalar_fields(offer, request.data or {})
-        details_qs = self._recalc_and_save(offer)
+        if details is None:
+            # No detail changes: reuse the prefetched rows for the
+            # recompute and the response build.
+            details = list(offer.details.all())
+
+        dirty = self._update_scalar_fields(offer, request.data or {})
+        if details_changed:
+            # Detail-only updates still have to move updated_at: it is
+            # the validator behind the retrieve ETag.
+            dirty.add('updated_at')
+        self._recalc_and_save(offer, details, dirty)
 
-        return Response(self._build_response(offer, details_qs), status=status.HTTP_200_OK)
+        return Response(self._build_response(offer, details), status=status.HTTP_200_OK)
 
     def _update_scalar_fields(self, offer, data):
         """Update simple scalar fields on the Offer instance.
 
         Only `title` and `description` are considered here. The method mutates
         the `offer` instance in memory; persistence happens in `_recalc_and_save`.
+
+        Returns the set of field names whose value actually changed, so
+        the save can be restricted to (or skipped for) real changes.
         """
 
+        dirty = set()
         for field in ['title', 'description']:
-            if field in data:
+            if field in data and data.get(field) != getattr(offer, field):
                 setattr(offer, field, data.get(field))
+                dirty.add(field)
+        return dirty
 
     def _update_details(self, offer, details_payload):
         """Apply updates to existing Detail rows for an Offer.
@@ -224,69 +319,117 @@ class OfferDetailView(generics.RetrieveUpdateDestroyAPIView):
             (title, revisions, delivery_time_in_days, price, features).
 
         Behavior:
-          - Builds a mapping of existing details by `offer_type`.
-          - For each item, finds the matching Detail and updates the fields
-            present in the item, then saves the Detail instance.
-          - If an unknown `offer_type` is provided, returns a DRF `Response`
-            with status 400 explaining the unknown type.
-
-        Returns:
-          - None on success
-          - `Response` instance on validation error (caller should return it)
+          - Builds a mapping of existing details by `offer_type` from the
+            prefetched cache (no extra query).
+          - Validates every item up front — `offer_type` against the
+            existing tiers, the remaining fields through
+            `DetailSerializer` — and returns a 400 `Response` before
+            touching any row, so an invalid payload can never leave a
+            partial write behind. The serializer pass also coerces raw
+            JSON values to the model field types (a string "50" becomes
+            int 50), since the in-memory instances feed the min()
+            recompute and the response build without a DB round trip.
+          - Then applies the validated fields of each item; all touched
+            rows are written with a single bulk_update restricted to the
+            fields actually modified.
+
+        Returns a `(error, details, changed)` tuple:
+          - `(None, list_of_details, changed)` on success — the in-memory
+            Detail instances (updated where requested), for the caller to
+            reuse in the response instead of re-querying, and whether any
+            row was actually written.
+          - `(Response, None, False)` on validation error (caller should
+            return it)
         """
 
-        if details_payload is None:
-            return None
-        if isinstance(details_payload, list):
-            existing_by_type = {d.offer_type: d for d in offer.details.all()}
+        if not isinstance(details_payload, list):
+            return None, None, False
+
+        # offer.details is prefetched by the view queryset, so this reads
+        # the cached rows rather than round-tripping the DB.
+        details = list(offer.details.all())
+        existing_by_type = {d.offer_type: d for d in details}
+
+        # Validation pass first: reject the whole payload before mutating
+        # anything, so a bad trailing item cannot leave earlier tiers
+        # half-updated. The serializer run also yields typed values for
+        # the mutation pass below.
+        validated_items = []
         for item in details_payload:
-            if isinstance(item, dict):
-                offer_type = item.get('offer_type')
+            offer_type = item.get('offer_type') if isinstance(item, dict) else None
             if offer_type not in existing_by_type:
-                return Response({'offer_type': f'Unknown offer_type: {offer_type}'}, status=status.HTTP_400_BAD_REQUEST)
+                return Response(
+                    {'offer_type': f'Unknown offer_type: {offer_type}'},
+                    status=status.HTTP_400_BAD_REQUEST), None, False
+            item_serializer = DetailSerializer(data=item, partial=True)
+            if not item_serializer.is_valid():
+                return Response(
+                    item_serializer.errors,
+                    status=status.HTTP_400_BAD_REQUEST), None, False
+            validated_items.append(
+                (offer_type, item_serializer.validated_data))
+
+        to_update = []
+        touched = set()
+        for offer_type, item in validated_items:
             detail = existing_by_type[offer_type]
-            for f in ['title', 'revisions', 'delivery_time_in_days', 'price', 'features']:
-                if f in item:
-                    setattr(detail, f, item.get(f))
-            detail.save()
-        return None
-
-    def _recalc_and_save(self, offer):
+            item_fields = [f for f in DETAIL_UPDATE_FIELDS if f in item]
+            if item_fields:
+                for f in item_fields:
+                    setattr(detail, f, item[f])
+                touched.update(item_fields)
+                to_update.append(detail)
+        if to_update:
+            # One UPDATE for all modified tiers, limited to touched columns
+            Detail.objects.bulk_update(to_update, fields=sorted(touched))
+        return None, details, bool(to_update)
+
+    def _recalc_and_save(self, offer, details, dirty):
         """Recalculate cached summary fields and persist the Offer.
 
-        - Recomputes `min_price` and `min_delivery_time` from related Detail rows
-          if they exist.
-        - Sets `updated_at` to now and saves changed fields.
-        - Returns the details queryset used for response construction.
+        - Recomputes `min_price` and `min_delivery_time` from the
+          in-memory detail list (already updated by `_update_details`),
+          so no aggregate query is issued on the PATCH path.
+        - Persists only the columns that actually changed (`dirty` from
+          the scalar pass plus any moved aggregate); a PATCH that
+          changed nothing on the offer row skips the UPDATE entirely.
         """
 
-        details_qs = offer.details.all()
-        if details_qs.exists():
-            offer.min_price = min(d.price for d in details_qs)
-            offer.min_delivery_time = min(
-                d.delivery_time_in_days for d in details_qs)
-        offer.updated_at = timezone.now()
-        offer.save(update_fields=['title', 'description',
-                   'min_price', 'min_delivery_time', 'updated_at'])
-        return details_qs
+        if details:
+            min_price = min(d.price for d in details)
+            min_delivery = min(d.delivery_time_in_days for d in details)
+            if min_price != offer.min_price:
+                offer.min_price = min_price
+                dirty.add('min_price')
+            if min_delivery != offer.min_delivery_time:
+                offer.min_delivery_time = min_delivery
+                dirty.add('min_delivery_time')
+        if not dirty:
+            return
+        # updated_at is auto_now: listing it in update_fields is enough
+        # for the ORM to stamp and persist it.
+        dirty.add('updated_at')
+        offer.save(update_fields=sorted(dirty))
 
     def _build_response(self, offer, details_qs):
         """Construct a compact response payload for the updated Offer.
 
         Returns a simple dict with id, title, image URL (or None), description
         and serialized details.
+
+        The image field is blank for most offers; checking the stored
+        filename instead of catching the FieldFile's ValueError keeps the
+        common case on the cheap boolean path.
         """
 
-        try:
-            image_url = offer.image.url
-        except Exception:
-            image_url = None
+        image = getattr(offer, 'image', None)
+        image_url = image.url if image and image.name else None
         return {
             'id': offer.id,
             'title': offer.title,
             'image': image_url,
             'description': offer.description,
-            'details': DetailSerializer(details_qs, many=True).data,
+            'details': _DETAIL_LIST_SERIALIZER.to_representation(details_qs),
         }
 
     def delete(self, request, *args, **kwargs):
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.7 on 2026-08-30 03:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='detail',
+            name='delivery_time_in_days',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='detail',
+            name='features',
+            field=models.JSONField(default=list),
+        ),
+        migrations.AlterField(
+            model_name='detail',
+            name='price',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='detail',
+            name='revisions',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='detail',
+            name='title',
+            field=models.CharField(default='', max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='offer',
+            name='min_delivery_time',
+            field=models.IntegerField(db_index=True, default=0),
+        ),
+        migrations.AlterField(
+            model_name='offer',
+            name='min_price',
+            field=models.IntegerField(db_index=True, default=0),
+        ),
+        migrations.AlterField(
+            model_name='offer',
+            name='title',
+            field=models.CharField(default='', max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='offer',
+            name='updated_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['min_delivery_time', 'min_price'], name='offers_app__min_del_9a0168_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['user', 'updated_at'], name='offers_app__user_id_75763e_idx'),
+        ),
+    ]
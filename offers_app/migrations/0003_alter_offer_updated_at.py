@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-08-30 03:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0002_alter_detail_delivery_time_in_days_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='offer',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -20,7 +20,7 @@ class Offer(models.Model):
         created_at (datetime):
             Timestamp set automatically when the offer is first created (auto_now_add=True).
         updated_at (datetime):
-            Intended to track the last modification time.
+            Timestamp refreshed automatically on every save (auto_now=True).
         min_price (int):
             Required integer representing the minimum price for the offer. Defaults to 0.
         min_delivery_time (int):
@@ -36,9 +36,16 @@ class Offer(models.Model):
     image = models.FileField(upload_to='offer_images/', blank=True, null=True)
     description = models.TextField(blank=True, default='')
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now_add=True)
-    min_price = models.IntegerField(default=0)
-    min_delivery_time = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    min_price = models.IntegerField(default=0, db_index=True)
+    min_delivery_time = models.IntegerField(default=0, db_index=True)
+
+    class Meta:
+        indexes = [
+            # Covers the common list filter + order combination
+            models.Index(fields=['min_delivery_time', 'min_price']),
+            models.Index(fields=['user', 'updated_at']),
+        ]
 
 
 class Detail(models.Model):
@@ -0,0 +1,28 @@
+"""
+Signal handlers for offers_app.
+
+The public offer listing is served from a short-TTL cache keyed on a
+version counter (see ``OfferListCreateView.list``). Any offer save or
+delete bumps the counter, so stale pages are never served past a write
+while untouched entries simply age out.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Offer
+
+# Version counter folded into every offer-list cache key. Bumping it
+# orphans all cached pages at once without enumerating their keys.
+OFFER_LIST_VERSION_KEY = 'offer_list:version'
+
+
+@receiver(post_save, sender=Offer)
+@receiver(post_delete, sender=Offer)
+def bump_offer_list_version(sender, **kwargs):
+    try:
+        cache.incr(OFFER_LIST_VERSION_KEY)
+    except ValueError:
+        # Counter not present yet (cold cache or evicted); seed it.
+        cache.set(OFFER_LIST_VERSION_KEY, 1, None)
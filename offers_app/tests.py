@@ -1,3 +1,72 @@
 from django.test import TestCase
 
-# Create your tests here.
+from rest_framework.authtoken.models import Token
+
+from auth_app.models import User
+from .models import Detail, Offer
+
+
+class OfferDetailPatchTests(TestCase):
+    """PATCH /api/offers/<pk>/ with nested detail payloads."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(
+            username='patch-owner', password='pw',
+            email='patch-owner@example.com', type=User.Type.BUSINESS)
+        cls.token = Token.objects.create(user=cls.owner).key
+        cls.offer = Offer.objects.create(
+            user=cls.owner, title='Offer', min_price=100,
+            min_delivery_time=3)
+        Detail.objects.bulk_create(
+            Detail(offer=cls.offer, offer_type=offer_type, price=price,
+                   delivery_time_in_days=days, revisions=1)
+            for offer_type, price, days in (
+                ('basic', 100, 3), ('standard', 200, 5), ('premium', 300, 7)))
+
+    def _patch(self, payload):
+        return self.client.patch(
+            '/api/offers/%d/' % self.offer.id, payload,
+            content_type='application/json',
+            HTTP_AUTHORIZATION='Token ' + self.token)
+
+    def test_string_numerics_are_coerced_before_recompute(self):
+        # JSON payloads may carry numbers as strings; the aggregate
+        # recompute runs over the in-memory instances, so the values
+        # must be coerced before min() compares them against ints.
+        response = self._patch(
+            {'details': [{'offer_type': 'basic', 'price': '50',
+                          'delivery_time_in_days': '2'}]})
+        self.assertEqual(response.status_code, 200)
+        self.offer.refresh_from_db()
+        self.assertEqual(self.offer.min_price, 50)
+        self.assertEqual(self.offer.min_delivery_time, 2)
+
+    def test_detail_fields_echo_typed_values(self):
+        # The PATCH response is built from the in-memory detail list, so
+        # every updatable column must come back with its model type, not
+        # the raw payload value.
+        response = self._patch(
+            {'details': [{'offer_type': 'basic', 'title': 'Basic tier',
+                          'price': '50', 'revisions': '7',
+                          'delivery_time_in_days': '2',
+                          'features': ['One revision']}]})
+        self.assertEqual(response.status_code, 200)
+        row = next(d for d in response.json()['details']
+                   if d['offer_type'] == 'basic')
+        self.assertEqual(row['price'], 50)
+        self.assertEqual(row['revisions'], 7)
+        self.assertEqual(row['delivery_time_in_days'], 2)
+        self.assertEqual(row['title'], 'Basic tier')
+        self.assertEqual(row['features'], ['One revision'])
+        persisted = Detail.objects.get(offer=self.offer, offer_type='basic')
+        self.assertEqual(persisted.price, 50)
+        self.assertEqual(persisted.revisions, 7)
+
+    def test_invalid_numeric_value_rejected_without_write(self):
+        response = self._patch(
+            {'details': [{'offer_type': 'basic', 'price': 'abc'}]})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            Detail.objects.get(offer=self.offer, offer_type='basic').price,
+            100)
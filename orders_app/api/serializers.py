@@ -1,11 +1,12 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 
+from core.serializers import CachedFieldsMixin
 from ..models import Order
 from offers_app.models import Detail
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for representing Order instances in API responses.
 
@@ -13,8 +14,9 @@ class OrderSerializer(serializers.ModelSerializer):
     read-only representation suitable for list/detail endpoints. Key behaviors:
 
     - customer_user and business_user:
-        - Exposed as IntegerFields sourced from the related user's `id` (source='customer_user.id'
-          and source='business_user.id').
+        - Exposed as IntegerFields sourced from the raw FK columns
+          (source='customer_user_id' / 'business_user_id'), so serializing a
+          row never dereferences the related User objects.
         - Both are read-only and return the primary key of the related user.
 
     - created_at and updated_at:
@@ -31,8 +33,8 @@ class OrderSerializer(serializers.ModelSerializer):
           equals the fields list). It is intended for serialization/representation only and not for
           creating or updating Order instances via incoming request data.
     """
-    customer_user = serializers.IntegerField(source='customer_user.id', read_only=True)
-    business_user = serializers.IntegerField(source='business_user.id', read_only=True)
+    customer_user = serializers.IntegerField(source='customer_user_id', read_only=True)
+    business_user = serializers.IntegerField(source='business_user_id', read_only=True)
     created_at = serializers.DateTimeField(format='%Y-%m-%dT%H:%M:%SZ', read_only=True)
     updated_at = serializers.DateTimeField(format='%Y-%m-%dT%H:%M:%SZ', read_only=True)
 
@@ -55,6 +57,46 @@ class OrderSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+class FastOrderSerializer(OrderSerializer):
+    """OrderSerializer with a hand-built read path.
+
+    Order rows are flat scalars, so the representation is assembled with
+    direct attribute access instead of DRF's per-field dispatch — the
+    same pattern as OfferSerializer.to_representation. Output matches
+    OrderSerializer exactly, including the UTC timestamp format.
+    """
+
+    def to_representation(self, instance):
+        return {
+            'id': instance.id,
+            'customer_user': instance.customer_user_id,
+            'business_user': instance.business_user_id,
+            'title': instance.title,
+            'revisions': instance.revisions,
+            'delivery_time_in_days': instance.delivery_time_in_days,
+            'price': instance.price,
+            'features': instance.features,
+            'offer_type': instance.offer_type,
+            'status': instance.status,
+            'created_at': instance.created_at.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'updated_at': instance.updated_at.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        }
+
+
+class CompactOrderSerializer(OrderSerializer):
+    """OrderSerializer minus the `features` payload.
+
+    Used for `?compact=1` listings together with `.defer('features')`:
+    the JSON column — typically the widest on the row — is neither
+    fetched nor decoded. Omitting the field here (rather than tolerating
+    its absence) also keeps a deferred row from lazy-loading it per row.
+    """
+
+    class Meta(OrderSerializer.Meta):
+        fields = [f for f in OrderSerializer.Meta.fields if f != 'features']
+        read_only_fields = fields
+
+
 class OrderCreateSerializer(serializers.Serializer):
     """
     Serializer for creating an Order from an existing Offer Detail.
@@ -83,6 +125,43 @@ class OrderCreateSerializer(serializers.Serializer):
     """
     offer_detail_id = serializers.IntegerField()
 
+    @staticmethod
+    def _resolve_detail(request, detail_id):
+        """Fetch a Detail (with its offer joined), memoized per request.
+
+        Only the columns copied onto the Order plus the offer's owner id
+        are selected — the order row stores `business_user_id`, so the
+        user table is never joined. Repeated resolutions of the same
+        detail within one request — for example a bulk checkout flow
+        driving this serializer several times — reuse the already-fetched
+        row instead of re-querying.
+        """
+        detail_cache = getattr(request, '_order_detail_cache', None)
+        if detail_cache is None:
+            detail_cache = request._order_detail_cache = {}
+        detail = detail_cache.get(detail_id)
+        if detail is None:
+            detail = Detail.objects.select_related('offer').only(
+                'id', 'title', 'revisions', 'delivery_time_in_days',
+                'price', 'features', 'offer_type',
+                'offer__id', 'offer__user',
+            ).get(id=detail_id)
+            detail_cache[detail_id] = detail
+        return detail
+
+    def validate_offer_detail_id(self, value):
+        """Check the referenced Detail exists during `is_valid`.
+
+        The fetch lands in the per-request memo, so `create` reuses the
+        row instead of querying again — the existence check costs no
+        extra statement overall.
+        """
+        try:
+            self._resolve_detail(self.context.get('request'), value)
+        except Detail.DoesNotExist:
+            raise serializers.ValidationError('Offer detail not found.')
+        return value
+
     def create(self, validated_data):
         request = self.context.get('request')
         user = getattr(request, 'user', None)
@@ -91,13 +170,16 @@ class OrderCreateSerializer(serializers.Serializer):
 
         detail_id = validated_data.get('offer_detail_id')
         try:
-            detail = Detail.objects.select_related('offer', 'offer__user').get(id=detail_id)
+            detail = self._resolve_detail(request, detail_id)
         except Detail.DoesNotExist:
             raise serializers.ValidationError({'offer_detail_id': 'Offer detail not found.'})
 
+        # objects.create() saves with force_insert=True, so no UPDATE
+        # probe precedes the INSERT; both FKs are assigned by raw id to
+        # skip descriptor coercion.
         order = Order.objects.create(
-            customer_user=user,
-            business_user=detail.offer.user,
+            customer_user_id=user.id,
+            business_user_id=detail.offer.user_id,
             title=detail.title,
             revisions=detail.revisions,
             delivery_time_in_days=detail.delivery_time_in_days,
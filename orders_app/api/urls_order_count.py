@@ -4,7 +4,6 @@ Defines URL routing for the order count endpoint used by the orders_app API.
 """
 
 from .views import OrderCountView
-from django.urls import reverse
 
 
 urlpatterns = [
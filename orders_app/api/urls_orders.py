@@ -2,17 +2,38 @@ from django.urls import path
 """
 URL configuration for the orders API endpoints.
 
-- The root path ('') is routed to OrderListCreateView and is intended to provide
-    listing of orders (GET) and creation of new orders (POST).
+- The root path ('') dispatches by HTTP method: GET goes to OrderListView
+    and POST to OrderCreateView. Each view carries fixed attributes, so no
+    per-request method branching happens inside the views themselves.
 - The detail path ('<int:pk>') is routed to OrderDetailView and is intended to
     provide retrieval, update, and deletion of a single order identified by its
     primary key (GET, PUT/PATCH, DELETE).
 """
 
-from .views import OrderListCreateView, OrderDetailView
+from django.views.decorators.csrf import csrf_exempt
+
+from .views import (OrderListView, OrderCreateView, OrderDetailView,
+                    OrderCountsView)
+
+
+_order_list = OrderListView.as_view()
+_order_create = OrderCreateView.as_view()
+
+
+@csrf_exempt
+def order_list_create(request, *args, **kwargs):
+    """Route the collection path to the method-specific view.
+
+    csrf_exempt mirrors what APIView.as_view() applies to the wrapped
+    views; DRF enforces its own session CSRF inside authentication.
+    """
+    if request.method == 'POST':
+        return _order_create(request, *args, **kwargs)
+    return _order_list(request, *args, **kwargs)
 
 
 urlpatterns = [
-    path('', OrderListCreateView.as_view(), name='order-create'),
+    path('', order_list_create, name='order-create'),
+    path('counts/<int:pk>/', OrderCountsView.as_view(), name='order-counts'),
     path('<int:pk>/', OrderDetailView.as_view(), name='order-detail')
 ]
@@ -6,7 +6,8 @@ Module summary
 This module provides API views for creating, listing and managing `Order`
 instances. It exposes endpoints to:
 
-- List/create orders for the authenticated user (`OrderListCreateView`).
+- List orders for the authenticated user (`OrderListView`) and create new
+    orders (`OrderCreateView`).
 - Retrieve, partially update (business side) or delete an order
     (`OrderDetailView`).
 - Query counts for a business: active orders and completed orders
@@ -19,82 +20,209 @@ Behavior & permissions
     validation) and `OrderSerializer` (for read responses).
 """
 
-from django.shortcuts import get_object_or_404
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.http import Http404
+from django.utils import timezone
 
 from rest_framework import status, generics
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from rest_framework.pagination import CursorPagination
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 
-from .serializers import OrderSerializer, OrderCreateSerializer
+from .serializers import (CompactOrderSerializer, FastOrderSerializer,
+                          OrderSerializer, OrderCreateSerializer)
 from .permissions import IsCustomerUser
 from ..models import Order
-from offers_app.models import Detail
 from auth_app.models import User
+from auth_app.signals import BUSINESS_EXISTS_KEY
+
+
+# Allowed order states, computed once at import instead of per PATCH.
+VALID_ORDER_STATUSES = frozenset(Order.Status.values)
+SORTED_ORDER_STATUSES = sorted(VALID_ORDER_STATUSES)
+
+# Columns fetched for the values()-based list path; the *_id keys are
+# renamed to the public customer_user/business_user names per row.
+ORDER_ROW_FIELDS = (
+    'id', 'customer_user_id', 'business_user_id', 'title', 'revisions',
+    'delivery_time_in_days', 'price', 'features', 'offer_type', 'status',
+    'created_at', 'updated_at')
+COMPACT_ORDER_ROW_FIELDS = tuple(
+    f for f in ORDER_ROW_FIELDS if f != 'features')
+
+# Shared permission instances: all three classes are stateless, so the
+# per-request allocations in get_permissions are pure overhead. The
+# tuples are copied into fresh lists on return since DRF may mutate the
+# list it receives.
+_AUTH_ONLY = (IsAuthenticated(),)
+_AUTH_CUSTOMER = (IsAuthenticated(), IsCustomerUser())
+_ADMIN_ONLY = (IsAdminUser(),)
+
+
+# How long a verified "pk is a business user" flag may be reused. These
+# endpoints are polled by dashboards, so the flag is usually hot; user
+# saves/deletes drop it early via auth_app.signals.
+BUSINESS_EXISTS_CACHE_TTL = 60
+
+
+def _business_order_count(pk, order_status):
+    """Count a business user's orders in `order_status` with one query.
+
+    When the existence of business user `pk` was verified recently (the
+    cached flag set below), the count is a direct probe of the
+    (business_user, status) index with no user join. Otherwise the
+    existence check and the COUNT are folded into a single statement — a
+    LEFT JOIN from the user row with a conditional aggregate — and the
+    flag is cached. Raises Http404 when `pk` is not a business user.
+    """
+
+    exists_key = BUSINESS_EXISTS_KEY % pk
+    if cache.get(exists_key):
+        return Order.objects.filter(
+            business_user_id=pk, status=order_status).count()
+
+    count = User.objects.filter(
+        id=pk, type=User.Type.BUSINESS,
+    ).annotate(
+        c=Count('business_orders',
+                filter=Q(business_orders__status=order_status)),
+    ).values_list('c', flat=True).first()
+    if count is None:
+        raise Http404('No business user matches the given query.')
+    cache.set(exists_key, True, BUSINESS_EXISTS_CACHE_TTL)
+    return count
+
+
+class OrderCursorPagination(CursorPagination):
+    """Keyset pagination for order listings.
+
+    Cursors follow (-created_at, -id) — served pre-sorted by the
+    composite (user, -created_at) indexes — so page cost stays
+    O(page_size) at any depth instead of OFFSET scan-and-discard.
+    """
 
+    ordering = ('-created_at', '-id')
+    page_size = 50
 
-class OrderListCreateView(generics.ListCreateAPIView):
-    """List orders for the authenticated user or create a new order.
 
-    GET (list):
+class OrderListView(generics.ListAPIView):
+    """List orders for the authenticated user.
+
+    GET:
       - Requires authentication.
       - If the authenticated user is a customer (user.type == 'customer'),
         returns orders where `customer_user == user`.
       - Otherwise returns orders where `business_user == user`.
       - Results are ordered by `-created_at`.
-
-    POST (create):
-      - Requires an authenticated customer (IsAuthenticated + IsCustomerUser).
-      - Uses `OrderCreateSerializer` and expects validated payload including
-        an `offer_detail_id` that must exist in `offers_app.models.Detail`.
-      - On success returns 201 with the created order serialized by
-        `OrderSerializer`.
     """
 
     queryset = Order.objects.all()
+    pagination_class = OrderCursorPagination
 
     def get_permissions(self):
-        """Return permission instances depending on HTTP method.
+        return list(_AUTH_ONLY)
+
+    def get_serializer_class(self):
+        """Select the read serializer.
 
-        - POST: IsAuthenticated + IsCustomerUser
-        - GET: IsAuthenticated
+        - `FastOrderSerializer` (hand-built read path) by default
+        - `CompactOrderSerializer` when `?compact=1` drops `features`
         """
 
-        if self.request.method == 'POST':
-            return [IsAuthenticated(), IsCustomerUser()]
-        return [IsAuthenticated()]
+        if self._compact_requested():
+            return CompactOrderSerializer
+        return FastOrderSerializer
 
-    def get_serializer_class(self):
-        """Select serializer class based on HTTP method.
+    def _compact_requested(self):
+        """True when the client asked for the features-free listing."""
+        return self.request.query_params.get('compact') == '1'
+
+    @staticmethod
+    def _render_row(row):
+        """Build the public payload for one values() row.
+
+        Returns a fresh dict — FK columns renamed to their public field
+        names, timestamps formatted — matching the serializer output
+        exactly. The source row is left untouched: the cursor paginator
+        derives the next-page position from its own page dicts after
+        this runs, so truncating their datetimes in place would corrupt
+        the cursor and drop rows that share a second.
+        """
+
+        out = dict(row)
+        out['customer_user'] = out.pop('customer_user_id')
+        out['business_user'] = out.pop('business_user_id')
+        out['created_at'] = out['created_at'].strftime('%Y-%m-%dT%H:%M:%SZ')
+        out['updated_at'] = out['updated_at'].strftime('%Y-%m-%dT%H:%M:%SZ')
+        return out
+
+    def list(self, request, *args, **kwargs):
+        """Serve the listing from values() dict rows.
 
-        - POST uses `OrderCreateSerializer` to validate creation input.
-        - GET uses `OrderSerializer` for read-only representations.
+        values() hands back plain dicts, skipping model construction per
+        row; the cursor paginator handles dict rows natively. Each page
+        row is rendered into a fresh output dict by _render_row.
         """
 
-        if self.request.method == 'POST':
-            return OrderCreateSerializer
-        return OrderSerializer
+        fields = (COMPACT_ORDER_ROW_FIELDS if self._compact_requested()
+                  else ORDER_ROW_FIELDS)
+        queryset = self.filter_queryset(self.get_queryset()).values(*fields)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(
+                [self._render_row(row) for row in page])
+        return Response([self._render_row(row) for row in queryset])
 
     def get_queryset(self):
         """Return a queryset scoped to the authenticated user.
 
-        - Unauthenticated requests receive an empty queryset.
-        - Customers see orders they created; businesses see orders for them.
+        Customers see orders they created; businesses see orders for
+        them. The IsAuthenticated permission has already rejected
+        anonymous requests by the time this runs.
         """
 
         user = self.request.user
-        if not user.is_authenticated:
-            return Order.objects.none()
-        if getattr(user, 'type', None) == 'customer':
-            return Order.objects.filter(customer_user=user).order_by('-created_at')
-        return Order.objects.filter(business_user=user).order_by('-created_at')
+        # The serializer reads only the raw *_id columns, so no join or
+        # per-row user fetch is needed on the list path. Ordering comes
+        # from the cursor paginator.
+        queryset = Order.objects.all()
+        if self._compact_requested():
+            # The widest column on the row; skipped entirely in compact
+            # mode (fetch and json decode).
+            queryset = queryset.defer('features')
+        # Direct attribute read: after the permission check this is
+        # always the project User model, so the getattr default could
+        # never apply.
+        if user.type == User.Type.CUSTOMER:
+            return queryset.filter(customer_user=user)
+        return queryset.filter(business_user=user)
+
+
+class OrderCreateView(generics.CreateAPIView):
+    """Create a new order from an offer detail.
+
+    POST:
+      - Requires an authenticated customer (IsAuthenticated + IsCustomerUser).
+      - Uses `OrderCreateSerializer` and expects validated payload including
+        an `offer_detail_id` that must exist in `offers_app.models.Detail`.
+      - On success returns 201 with the created order serialized by
+        `FastOrderSerializer`.
+    """
+
+    serializer_class = OrderCreateSerializer
+
+    def get_permissions(self):
+        return list(_AUTH_CUSTOMER)
 
     def create(self, request, *args, **kwargs):
         """Create a new Order.
 
-        This view delegates validation to `OrderCreateSerializer`. After
-        validating, it ensures the referenced `offer_detail_id` exists and
-        then saves the order associated with the request user.
+        This view delegates validation to `OrderCreateSerializer`, which
+        checks the referenced `offer_detail_id` exists (memoizing the
+        fetched row for `create`), then saves the order associated with
+        the request user.
 
         Returns 201 with the serialized order on success.
         """
@@ -102,10 +230,12 @@ class OrderListCreateView(generics.ListCreateAPIView):
         serializer = OrderCreateSerializer(
             data=request.data, context={'request': request})
         serializer.is_valid(raise_exception=True)
-        offer_detail_id = serializer.validated_data.get('offer_detail_id')
-        get_object_or_404(Detail, id=offer_detail_id)
         order = serializer.save()
-        return Response(OrderSerializer(order).data, status=status.HTTP_201_CREATED)
+        # The write serializer's .data is never touched, so its output
+        # path is never evaluated; the response renders through the
+        # hand-built read path.
+        return Response(FastOrderSerializer(order).data,
+                        status=status.HTTP_201_CREATED)
 
 
 class OrderDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -128,8 +258,8 @@ class OrderDetailView(generics.RetrieveUpdateDestroyAPIView):
         """
 
         if self.request.method == 'DELETE':
-            return [IsAdminUser()]
-        return [IsAuthenticated()]
+            return list(_ADMIN_ONLY)
+        return list(_AUTH_ONLY)
 
     def delete(self, request, *args, **kwargs):
         """Delete an Order (admin only)."""
@@ -154,16 +284,57 @@ class OrderDetailView(generics.RetrieveUpdateDestroyAPIView):
         if new_status is None:
             return Response({'status': 'This field is required.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        valid_statuses = {choice for (choice, _label) in Order.Status.choices}
-        if new_status not in valid_statuses:
-            return Response({'status': f'Invalid value. Allowed: {sorted(valid_statuses)}'}, status=status.HTTP_400_BAD_REQUEST)
+        if new_status not in VALID_ORDER_STATUSES:
+            return Response({'status': f'Invalid value. Allowed: {SORTED_ORDER_STATUSES}'}, status=status.HTTP_400_BAD_REQUEST)
 
+        # queryset.update skips signal dispatch and model re-rendering;
+        # the in-memory instance is patched to match for the response.
+        now = timezone.now()
+        Order.objects.filter(pk=order.pk).update(
+            status=new_status, updated_at=now)
         order.status = new_status
-        order.save(update_fields=['status', 'updated_at'])
+        order.updated_at = now
 
         return Response(OrderSerializer(order).data, status=status.HTTP_200_OK)
 
 
+class OrderCountsView(APIView):
+    """Return both order counts for a business user in one response.
+
+    Path parameter: `pk` is the id of the business user. Returns
+    {"order_count": <in_progress>, "completed_order_count": <completed>}
+    from a single conditional-aggregate query, so dashboards that need
+    both numbers make one request and one SELECT instead of two of each.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk):
+        exists_key = BUSINESS_EXISTS_KEY % pk
+        if cache.get(exists_key):
+            agg = Order.objects.filter(business_user_id=pk).aggregate(
+                in_progress=Count(
+                    'id', filter=Q(status=Order.Status.IN_PROGRESS)),
+                completed=Count(
+                    'id', filter=Q(status=Order.Status.COMPLETED)))
+        else:
+            agg = User.objects.filter(
+                id=pk, type=User.Type.BUSINESS,
+            ).annotate(
+                in_progress=Count('business_orders', filter=Q(
+                    business_orders__status=Order.Status.IN_PROGRESS)),
+                completed=Count('business_orders', filter=Q(
+                    business_orders__status=Order.Status.COMPLETED)),
+            ).values('in_progress', 'completed').first()
+            if agg is None:
+                raise Http404('No business user matches the given query.')
+            cache.set(exists_key, True, BUSINESS_EXISTS_CACHE_TTL)
+        return Response({
+            'order_count': agg['in_progress'],
+            'completed_order_count': agg['completed'],
+        })
+
+
 class OrderCountView(APIView):
     """Return the count of in-progress orders for a business user.
 
@@ -175,11 +346,7 @@ class OrderCountView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request, pk):
-        get_object_or_404(User, id=pk, type=User.Type.BUSINESS)
-        count = Order.objects.filter(
-            business_user=pk,
-            status='in_progress'
-        ).count()
+        count = _business_order_count(pk, Order.Status.IN_PROGRESS)
         return Response({"order_count": count})
 
 
@@ -193,9 +360,5 @@ class OrderCompleteView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request, pk):
-        get_object_or_404(User, id=pk, type=User.Type.BUSINESS)
-        count = Order.objects.filter(
-            business_user=pk,
-            status='completed'
-        ).count()
+        count = _business_order_count(pk, Order.Status.COMPLETED)
         return Response({"completed_order_count": count})
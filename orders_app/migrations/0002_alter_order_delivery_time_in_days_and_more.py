@@ -0,0 +1,57 @@
+# Generated by Django 5.2.7 on 2026-08-30 03:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders_app', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='order',
+            name='delivery_time_in_days',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='features',
+            field=models.JSONField(default=list),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='price',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='revisions',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='status',
+            field=models.CharField(choices=[('in_progress', 'In Progress'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], default='in_progress', max_length=12),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='title',
+            field=models.CharField(default='', max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['business_user', 'status'], name='orders_app__busines_7d89bd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['customer_user', '-created_at'], name='orders_app__custome_8fd7c9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['business_user', '-created_at'], name='orders_app__busines_1505e0_idx'),
+        ),
+    ]
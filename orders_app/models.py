@@ -86,5 +86,15 @@ class Order(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Count endpoints probe (business_user, status) directly
+            models.Index(fields=['business_user', 'status']),
+            # List branches filter by one user column and order by
+            # -created_at; these serve the rows pre-sorted
+            models.Index(fields=['customer_user', '-created_at']),
+            models.Index(fields=['business_user', '-created_at']),
+        ]
+
     def __str__(self):
         return f"Order #{self.id} - {self.title}"
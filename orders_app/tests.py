@@ -1,3 +1,41 @@
 from django.test import TestCase
+from django.utils import timezone
 
-# Create your tests here.
+from rest_framework.authtoken.models import Token
+
+from auth_app.models import User
+from .models import Order
+
+
+class OrderListPaginationTests(TestCase):
+    """Walk the cursor-paginated order list across page boundaries."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer = User.objects.create_user(
+            username='cursor-customer', password='pw',
+            email='cursor-customer@example.com', type=User.Type.CUSTOMER)
+        cls.business = User.objects.create_user(
+            username='cursor-business', password='pw',
+            email='cursor-business@example.com', type=User.Type.BUSINESS)
+        cls.token = Token.objects.create(user=cls.customer).key
+        Order.objects.bulk_create(
+            Order(customer_user=cls.customer, business_user=cls.business,
+                  title='Order %d' % i)
+            for i in range(120))
+        # Collapse every created_at onto the same second so the cursor
+        # must fall back to the -id tie-breaker to separate rows.
+        Order.objects.update(created_at=timezone.now().replace(microsecond=0))
+
+    def test_all_rows_reachable_across_pages(self):
+        seen = []
+        url = '/api/orders/'
+        while url:
+            response = self.client.get(
+                url, HTTP_AUTHORIZATION='Token ' + self.token)
+            self.assertEqual(response.status_code, 200)
+            payload = response.json()
+            seen.extend(row['id'] for row in payload['results'])
+            url = payload['next']
+        self.assertCountEqual(
+            seen, Order.objects.values_list('id', flat=True))
@@ -4,5 +4,8 @@ from .models import Review
 class ReviewAdmin(admin.ModelAdmin):
     list_display = ['business_user__username', 'reviewer__username', 'rating', 'created_at']
     list_filter = ['rating']
+    # Join the user rows in the changelist query instead of one SELECT
+    # per displayed username.
+    list_select_related = ('business_user', 'reviewer')
 
 admin.site.register(Review, ReviewAdmin)
\ No newline at end of file
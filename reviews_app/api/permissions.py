@@ -1,25 +1,26 @@
 from rest_framework import permissions
 
+from core.permissions import cached_user_type
+
 class IsCustomerUser(permissions.BasePermission):
     """
     Permission class that allows access only to users
     whose 'type' attribute is equal to 'customer'.
-    Its has_permission method returns True when request.user.type == 'customer',
-    and False otherwise.
+    Its has_permission method returns True when the authenticated user's
+    type is 'customer', and False otherwise (including for anonymous
+    users, which have no 'type'). The resolved type is memoized on the
+    request, since DRF can evaluate permissions more than once per request.
     """
     def has_permission(self, request, view):
-        if request.user.type == 'customer':
-            return True
-    
-        return False
+        user = request.user
+        return bool(user and user.is_authenticated
+                    and cached_user_type(request) == 'customer')
     
 class IsReviewer(permissions.BasePermission):
     """Allow object-level access only to the object's reviewer.
-    It grants access to an object only when the requesting user (request.user) is
-    the same as the object's `reviewer` attribute.
+    It grants access to an object only when the requesting user's id
+    matches the review's `reviewer_id` column — compared directly so the
+    related User row is never materialized for the check.
     """
     def has_object_permission(self, request, view, obj):
-        if request.user == obj.reviewer:
-            return True
-        
-        return False
\ No newline at end of file
+        return request.user.is_authenticated and request.user.pk == obj.reviewer_id
\ No newline at end of file
@@ -1,9 +1,10 @@
 from rest_framework import serializers
 
+from core.serializers import CachedFieldsMixin
 from ..models import Review
 
 
-class ReviewSerializer(serializers.ModelSerializer):
+class ReviewSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the Review model.
     Provides serialization and validation for creating and updating Review instances.
@@ -18,15 +19,16 @@ class ReviewSerializer(serializers.ModelSerializer):
         - updated_at (read-only; formatted as '%Y-%m-%dT%H:%M:%SZ')
     - read_only_fields ensures 'reviewer', 'created_at', and 'updated_at' are not writable via input.
     Validation:
-    - validate(self, attrs):
-        - Obtains the current user from self.context['request'] and treats it as the reviewer.
-        - Ensures a reviewer can only create one review per business_user by checking
-          Review.objects.filter(reviewer=reviewer, business_user=business_user).
-        - Raises serializers.ValidationError("You have already rated this user.") if a duplicate exists.
+    - The one-review-per-business rule is enforced by the database unique
+      constraint on (reviewer, business_user); the view converts the
+      IntegrityError from a duplicate INSERT into a 400. No pre-check
+      query runs here.
     Field access control on updates:
-    - get_fields(self):
-        - Inspects the request method (from self.context['request']).
-        - Marks 'business_user' as read-only for PATCH and PUT requests to prevent changing the target user during updates.
+    - __init__ marks 'business_user' as read-only for PATCH and PUT
+      requests to prevent changing the target user during updates. The
+      flip mutates this instance's field copies (CachedFieldsMixin hands
+      out per-instance copies), so no per-request model introspection
+      pass is needed.
     """
     created_at = serializers.DateTimeField(format='%Y-%m-%dT%H:%M:%SZ', read_only=True)
     updated_at = serializers.DateTimeField(format='%Y-%m-%dT%H:%M:%SZ', read_only=True)
@@ -37,22 +39,8 @@ class ReviewSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['reviewer', 'created_at', 'updated_at']
 
-    def validate(self, attrs):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
         request = self.context.get('request')
-        reviewer = request.user
-        business_user = attrs.get('business_user')
-
-        if Review.objects.filter(reviewer=reviewer, business_user=business_user).exists():
-            raise serializers.ValidationError(
-                "You have already rated this user."
-            )
-        return attrs
-    
-    def get_fields(self):
-        fields = super().get_fields()
-        request = self.context.get('request')
-
-        if request and request.method in ['PATCH', 'PUT']:
-            fields['business_user'].read_only = True
-
-        return fields
+        if request and request.method in ('PATCH', 'PUT'):
+            self.fields['business_user'].read_only = True
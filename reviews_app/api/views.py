@@ -1,13 +1,46 @@
-from django.utils import timezone
+from django.db import IntegrityError, transaction
 from django_filters.rest_framework import DjangoFilterBackend
 
-from rest_framework import generics, permissions, filters
+from rest_framework import generics
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import CursorPagination
 from rest_framework.permissions import IsAuthenticated
 
 from .permissions import IsCustomerUser, IsReviewer
 from .serializers import ReviewSerializer
 from ..models import Review
 
+
+# Shared stateless permission instances; handed out as copies so DRF's
+# occasional list mutation can't leak between requests.
+_GET_PERMS = (IsAuthenticated(),)
+_WRITE_PERMS = (IsAuthenticated(), IsCustomerUser())
+
+
+class ConditionalDjangoFilterBackend(DjangoFilterBackend):
+    """DjangoFilterBackend that skips filterset construction entirely
+    when the request carries none of the view's filter params — the
+    common "list everything" case pays nothing for the backend."""
+
+    def filter_queryset(self, request, queryset, view):
+        params = set(view.filterset_fields) & set(request.query_params)
+        if not params:
+            return queryset
+        return super().filter_queryset(request, queryset, view)
+
+
+class ReviewCursorPagination(CursorPagination):
+    """Keyset pagination over reviews, newest first.
+
+    Cursor pages seek on the (updated_at, id) index instead of running
+    OFFSET scans, and no COUNT(*) query is issued per page. The id
+    tie-breaker keeps the ordering total when timestamps collide.
+    """
+    ordering = ('-updated_at', '-id')
+    page_size = 20
+
+
 class ReviewListCreateView(generics.ListCreateAPIView):
     """
     APIView for listing existing Review instances and creating new ones.
@@ -19,33 +52,51 @@ class ReviewListCreateView(generics.ListCreateAPIView):
     - serializer_class: ReviewSerializer
     - Default permission_classes: IsAuthenticated (additional IsCustomerUser required for non-GET methods via get_permissions).
     - Filtering: enabled via DjangoFilterBackend; clients can filter by business_user_id and reviewer_id.
-    - Searching and ordering: SearchFilter and OrderingFilter are enabled; allowed ordering fields are updated_at and rating.
+    - Ordering: OrderingFilter is enabled; allowed ordering fields are updated_at and rating.
     - On creation, perform_create() automatically assigns reviewer=self.request.user to the saved instance.
     Expected inputs:
     - For filtering: ?business_user_id=<id>&reviewer_id=<id>
     - For ordering: ?ordering=updated_at or ?ordering=-rating
-    - For searching: dependent on serializer/search_fields configuration (SearchFilter enabled).
     Errors and responses:
     - 401 Unauthorized if the request is unauthenticated.
     - 403 Forbidden if an authenticated user lacks IsCustomerUser permission for write operations.
     - 400 Bad Request for serializer validation errors.
     """
-    queryset = Review.objects.all()
     serializer_class = ReviewSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = ReviewCursorPagination
 
-    filter_backends = [DjangoFilterBackend,
-                       filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [ConditionalDjangoFilterBackend, OrderingFilter]
     filterset_fields = ['business_user_id', 'reviewer_id']
     ordering_fields = ['updated_at', 'rating']
- 
+
+    def get_queryset(self):
+        """Project just the serialized columns for list responses.
+
+        The list serializer emits the FK ids straight off the review
+        row, so no user join is needed here (the detail view keeps it);
+        only() narrows the fetch to exactly what gets rendered.
+        """
+        return Review.objects.only(
+            'id', 'business_user_id', 'reviewer_id', 'rating',
+            'description', 'created_at', 'updated_at')
+
     def get_permissions(self):
         if self.request.method == 'GET':
-            return [IsAuthenticated()]
-        return [IsAuthenticated(), IsCustomerUser()]
+            return list(_GET_PERMS)
+        return list(_WRITE_PERMS)
 
     def perform_create(self, serializer):
-        serializer.save(reviewer=self.request.user)
+        # The duplicate check lives in the DB unique constraint on
+        # (reviewer, business_user): the INSERT either lands or raises,
+        # with no racy pre-check query. atomic() adds a savepoint so the
+        # catch stays valid inside an enclosing transaction too.
+        try:
+            with transaction.atomic():
+                serializer.save(reviewer=self.request.user)
+        except IntegrityError:
+            raise ValidationError(
+                {'business_user': 'You have already rated this user.'})
 
 class ReviewDetailView(generics.RetrieveUpdateDestroyAPIView):
     """
@@ -53,18 +104,36 @@ class ReviewDetailView(generics.RetrieveUpdateDestroyAPIView):
     This view is a DRF RetrieveUpdateDestroyAPIView configured to work with the Review model
     using ReviewSerializer. It exposes the following HTTP operations:
     - GET: Retrieve a serialized representation of a Review instance.
-    - PATCH: Validate and update a Review instance; on successful update the instance's
-        `updated_at` timestamp is set to django.utils.timezone.now() via perform_update.
+    - PATCH: Validate and update a Review instance; `updated_at` is refreshed
+        automatically by the model's auto_now field.
     - DELETE: Remove a Review instance (delete delegates to the standard destroy() flow).
     Access control:
     - Requires authentication and that the requester satisfies the IsReviewer permission.
     """
-    queryset = Review.objects.all()
     serializer_class = ReviewSerializer
     permission_classes = [IsAuthenticated, IsReviewer]
 
-    def delete(self, request, *args, **kwargs):
-        return self.destroy(request, *args, **kwargs)
-    
+    def get_queryset(self):
+        return Review.objects.select_related('reviewer', 'business_user')
+
     def perform_update(self, serializer):
-        serializer.save(updated_at=timezone.now())
\ No newline at end of file
+        """Write only the columns the PATCH actually changed.
+
+        The default serializer save re-sends every column in the UPDATE.
+        This compares validated values against the loaded row and saves
+        with update_fields (plus updated_at, which auto_now still stamps
+        when listed); a no-op PATCH issues no UPDATE at all.
+        """
+        review = serializer.instance
+        dirty = set()
+        for field, value in serializer.validated_data.items():
+            if getattr(review, field) != value:
+                setattr(review, field, value)
+                dirty.add(field)
+        if not dirty:
+            return
+        dirty.add('updated_at')
+        review.save(update_fields=sorted(dirty))
+
+    def delete(self, request, *args, **kwargs):
+        return self.destroy(request, *args, **kwargs)
\ No newline at end of file
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-08-30 03:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews_app', '0003_review_reviews_app_updated_b3dbb9_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='review',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
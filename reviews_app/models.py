@@ -13,12 +13,14 @@ class Review(models.Model):
     - rating (int): Integer rating constrained to the range 0–5 (inclusive) via MinValueValidator and MaxValueValidator.
     - description (str): Optional textual details of the review. Blank by default and defaults to an empty string.
     - created_at (datetime): Timestamp automatically set when the review is first created.
-    - updated_at (datetime): Timestamp intended to record the last update time. (Note: typically this should use auto_now=True so it updates on each save.)
+    - updated_at (datetime): Timestamp automatically refreshed on every save via auto_now=True.
 
     Behavior and constraints
     - rating must be an integer between 0 and 5 inclusive.
     - Both business_user and reviewer reference the configured AUTH_USER_MODEL; consider enforcing that they are not the same user if self-reviews are disallowed.
     - Deleting either referenced user will delete associated reviews due to on_delete=models.CASCADE.
+    - A reviewer may rate a given business user only once, enforced by a
+      database unique constraint on (reviewer, business_user).
     """
     business_user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -34,4 +36,22 @@ class Review(models.Model):
         validators=[MinValueValidator(0), MaxValueValidator(5)])
     description = models.TextField(blank=True, default='')
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            # One review per (reviewer, business) pair; enforced by the
+            # engine so concurrent POSTs cannot race past a pre-check.
+            models.UniqueConstraint(
+                fields=['reviewer', 'business_user'],
+                name='uniq_reviewer_business',
+            ),
+        ]
+        indexes = [
+            # Ordering-only listings; the unique constraint above
+            # already covers (reviewer, business_user) lookups.
+            models.Index(fields=['-updated_at']),
+            models.Index(fields=['-rating']),
+            # Business profile pages: filter by business, newest first.
+            models.Index(fields=['business_user', '-updated_at']),
+        ]